@@ -0,0 +1,18 @@
+# gunicorn.conf.py
+"""
+gunicorn settings for the PyTerminal web app.
+
+Run from the repository root:
+    gunicorn web_app.app:app
+
+The handlers are I/O bound (reading files, listing directories), so gevent
+workers let each process serve many clients at once, and large `cat` output
+goes out through sendfile(2) via wsgi.file_wrapper.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+worker_connections = 1000
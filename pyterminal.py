@@ -2,22 +2,27 @@
 """
 pyterminal.py
 A simple Python-based command terminal (CLI) with:
- - built-in commands: ls, cd, pwd, mkdir, rm, cat, touch, ps, sys, history
+ - built-in commands: ls, cd, pwd, mkdir, rm, cat, touch, ps, top, sys, history
  - run shell commands with `! your command` or `shell your command`
  - basic file-path tab-completion
- - persistent command history (~/.pyterm_history)
+ - persistent command history (~/.pyterm_history); `--script` disables it for batch use
  - uses psutil (if available) for system/process info
 """
 
+import argparse
+import bisect
 import os
 import shlex
 import subprocess
 import shutil
 import sys
+import time
 import glob
+import itertools
 import cmd
-import stat
-from pathlib import Path
+import collections
+import fnmatch
+import functools
 
 # optional imports
 try:
@@ -31,14 +36,42 @@ except Exception:
     psutil = None
 
 
-HISTORY_FILE = os.path.expanduser("~/.pyterm_history")
+_HOME = os.path.expanduser("~")
+# expanduser drops the home directory's trailing separator before joining ("/" -> "")
+_HOME_PREFIX = _HOME.rstrip(os.sep)
+HISTORY_FILE = os.path.join(_HOME, ".pyterm_history")
+# marks the end of each command's output from the persistent shell
+SHELL_SENTINEL = f"__PYTERM_END_{os.getpid()}__"
+HISTORY_MAXLEN = 1000  # commands kept in memory for `history`
+HISTORY_FLUSH_EVERY = 50  # append new history to disk every N commands
+COMPLETE_PATH_CHARS = "/*?[]~-"  # not word breaks for tab-completion
+CAT_BUFSIZE = 128 * 1024  # chunk size for streaming file contents
 
 
+@functools.lru_cache(maxsize=1024)
 def _expand_path(p: str) -> str:
-    """Expand user (~) and environment variables and return normalized path."""
+    """Expand user (~) and environment variables and return normalized path.
+
+    Cached: our own environment and home directory don't change while the
+    terminal runs (shell commands modify the child shell's, not ours).
+    """
     if not p:
         return p
-    return os.path.normpath(os.path.expandvars(os.path.expanduser(p)))
+    if p == "~":
+        p = _HOME
+    elif p.startswith(("~/", "~" + os.sep)):
+        # the common case needs no passwd lookup
+        p = _HOME_PREFIX + p[1:]
+    else:
+        p = os.path.expanduser(p)
+    return os.path.normpath(os.path.expandvars(p))
+
+
+def _split(arg: str) -> list:
+    """Split a command line into words; shlex is only needed for quotes and escapes."""
+    if any(c in arg for c in "\"'\\"):
+        return shlex.split(arg)
+    return arg.split()
 
 
 def _is_dir(path: str) -> bool:
@@ -48,19 +81,95 @@ def _is_dir(path: str) -> bool:
         return False
 
 
+def _run_program(argv: list) -> subprocess.CompletedProcess:
+    """Run an external program in the foreground and wait for it.
+
+    The program is resolved on PATH up front and close_fds is off, which lets
+    subprocess use posix_spawn (vfork + exec) rather than fork + exec plus an
+    fd-closing pass. Nothing leaks into the child: Python creates its fds
+    non-inheritable (PEP 446).
+    """
+    exe = shutil.which(argv[0])
+    if exe is None:
+        raise FileNotFoundError(argv[0])
+    return subprocess.run(argv, executable=exe, close_fds=False)
+
+
+def _entry_is_dir(entry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_dir(base_dir: str, dev: int, ino: int, mtime_ns: int) -> tuple:
+    """Return the sorted entry names in base_dir.
+
+    dev, ino and mtime_ns are only part of the cache key: they identify the
+    directory itself (a relative base_dir such as "." changes meaning after cd)
+    and its mtime changes whenever an entry is added or removed.
+    """
+    with os.scandir(base_dir) as it:
+        return tuple(sorted(e.name for e in it))
+
+
+def _dir_names(base_dir: str):
+    """Return the cached sorted listing of base_dir, or None if it can't be read."""
+    try:
+        st = os.stat(base_dir)
+        return _scan_dir(base_dir, st.st_dev, st.st_ino, st.st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _split_glob_prefix(p: str):
+    """Split p into (literal directory, pattern relative to it) at the first wildcard."""
+    i = len(p)
+    for c in "*?[":
+        j = p.find(c)
+        if j != -1:
+            i = min(i, j)
+    sep = p.rfind(os.sep, 0, i)
+    if sep < 0:
+        return "", p
+    return p[:sep] or os.sep, p[sep + 1:]
+
+
 def _list_matches(prefix: str):
     """Return filesystem names matching prefix (for completion)."""
-    if prefix == "":
-        prefix = "."
-    # Use glob to handle patterns and prefix
-    base_dir = os.path.dirname(prefix) or "."
-    pattern = os.path.basename(prefix) + "*"
-    try:
-        candidates = glob.glob(os.path.join(base_dir, pattern))
-    except Exception:
-        candidates = []
-    # Normalize names for completion
-    return [c if os.path.isabs(prefix) else c for c in candidates]
+    if not any(c in prefix for c in "*?["):
+        # literal prefix (the common case): binary search the sorted listing
+        dirname, head = os.path.split(prefix)
+        # list the expanded directory but keep the user's spelling (e.g. ~/) in results
+        names = _dir_names(_expand_path(dirname) or ".")
+        if names is None:
+            return []
+        out = []
+        for i in range(bisect.bisect_left(names, head), len(names)):
+            name = names[i]
+            if not name.startswith(head):
+                break
+            # like glob, hide dotfiles unless the prefix asks for them
+            if head or not name.startswith("."):
+                out.append(os.path.join(dirname, name))
+        return out
+
+    dirname, head = _split_glob_prefix(prefix)
+    if os.sep in head:
+        # wildcards in a directory component: let glob walk it
+        try:
+            return glob.glob(prefix + "*")
+        except Exception:
+            return []
+    names = _dir_names(_expand_path(dirname) or ".")
+    if names is None:
+        return []
+    # only the part after the literal directory is matched, against one listing;
+    # fnmatch.filter compiles the pattern once (and caches it) for the whole list
+    hidden = head.startswith(".")
+    return [os.path.join(dirname, n) for n in fnmatch.filter(names, head + "*")
+            if hidden or not n.startswith(".")]
 
 
 class PyTerminal(cmd.Cmd):
@@ -68,17 +177,34 @@ class PyTerminal(cmd.Cmd):
     ruler = "-"
     file = None
 
-    def __init__(self):
+    def __init__(self, script: bool = False):
         super().__init__()
-        self.prompt = f"{os.getcwd()} $ "
-        self.history = []
+        self._cwd = os.getcwd()
+        self.prompt = f"{self._cwd} $ "
+        # bounded ring buffer; _history_total counts every command this session
+        self.history = collections.deque(maxlen=HISTORY_MAXLEN)
+        self._history_total = 0
+        # command name -> bound do_* method, used by onecmd
+        self._dispatch = {n[3:]: getattr(self, n) for n in dir(self) if n.startswith("do_")}
+        # persistent bash for `shell` / `!`, started on first use
+        self._sh = None
+        # script mode: read plain lines from stdin and never touch readline
+        self.script = script
+        self.use_history = bool(readline) and not script
+        if script:
+            # no banner or prompt, so the output can be piped cleanly
+            self.use_rawinput = False
+            self.intro = None
+            self.prompt = ""
         # load persistent history (readline)
-        if readline:
+        if self.use_history:
             try:
                 readline.read_history_file(HISTORY_FILE)
             except Exception:
                 # no history file yet
                 pass
+            # entries past this index are new this session and not yet on disk
+            self._hist_baseline = readline.get_current_history_length()
 
     # -------------------------
     # helper internals
@@ -88,22 +214,80 @@ class PyTerminal(cmd.Cmd):
         line = line.strip()
         if line:
             self.history.append(line)
-            if readline:
+            self._history_total += 1
+            if self.use_history:
                 try:
                     readline.add_history(line)
-                    # write immediately to file for persistence
-                    try:
-                        readline.write_history_file(HISTORY_FILE)
-                    except Exception:
-                        pass
                 except Exception:
                     pass
+                # persist in batches rather than rewriting the file every command
+                if readline.get_current_history_length() - self._hist_baseline >= HISTORY_FLUSH_EVERY:
+                    self.save_history()
         return line
 
-    def postcmd(self, stop: bool, line: str):
-        # update prompt to reflect current directory
-        self.prompt = f"{os.getcwd()} $ "
-        return stop
+    def save_history(self, final: bool = False):
+        """Append this session's new history entries to HISTORY_FILE.
+
+        Readline builds without append_history_file (some libedit versions)
+        rewrite the whole file instead, so they only save when final is set.
+        """
+        if not self.use_history:
+            return
+        try:
+            length = readline.get_current_history_length()
+            n = length - self._hist_baseline
+            if n <= 0:
+                return
+            append = getattr(readline, "append_history_file", None)
+            if append is None:
+                if not final:
+                    return
+                readline.write_history_file(HISTORY_FILE)
+            else:
+                try:
+                    append(n, HISTORY_FILE)
+                except FileNotFoundError:
+                    # appending requires an existing file; create it on first save
+                    readline.write_history_file(HISTORY_FILE)
+            self._hist_baseline = length
+        except Exception:
+            pass
+
+    def onecmd(self, line: str):
+        """Dispatch one command line via the precomputed do_* table.
+
+        Same behaviour as cmd.Cmd.onecmd (including the `?` and `!` shortcuts,
+        and splitting the name at the first non-identchar, so `ls-la` runs
+        `ls` with `-la`) without a getattr per command.
+        """
+        line = line.strip()
+        if not line:
+            return self.emptyline()
+        if line[0] == "?":
+            line = "help " + line[1:]
+        elif line[0] == "!":
+            line = "shell " + line[1:]
+        i, n = 0, len(line)
+        identchars = self.identchars
+        while i < n and line[i] in identchars:
+            i += 1
+        name, arg = line[:i], line[i:].strip()
+        self.lastcmd = "" if line == "EOF" else line
+        fn = self._dispatch.get(name) if name else None
+        if fn is None:
+            return self.default(line)
+        return fn(arg)
+
+    def preloop(self):
+        # readline's default delimiters split words at / * ? [ ] ~ and -, so
+        # completers would only ever see the last path component; keep whole paths
+        if readline and self.use_rawinput and self.completekey:
+            self._old_delims = readline.get_completer_delims()
+            readline.set_completer_delims("".join(c for c in self._old_delims if c not in COMPLETE_PATH_CHARS))
+
+    def postloop(self):
+        if readline and self.use_rawinput and self.completekey:
+            readline.set_completer_delims(self._old_delims)
 
     def emptyline(self):
         # do nothing on empty line (override cmd.Cmd behaviour which repeats last command)
@@ -114,19 +298,15 @@ class PyTerminal(cmd.Cmd):
     # -------------------------
     def do_ls(self, arg):
         """ls [path] — list files and directories in path (default: current directory)."""
-        args = shlex.split(arg)
+        args = _split(arg)
         path = _expand_path(args[0]) if args else "."
         try:
-            entries = os.listdir(path)
-            entries.sort()
-            for name in entries:
-                full = os.path.join(path, name)
-                try:
-                    mode = os.stat(full).st_mode
-                    suffix = "/" if stat.S_ISDIR(mode) else ""
-                except Exception:
-                    suffix = ""
-                print(name + suffix)
+            # DirEntry.is_dir() uses d_type from the directory read, no stat per entry
+            with os.scandir(path) as it:
+                rows = [(e.name, "/" if _entry_is_dir(e) else "") for e in it]
+            rows.sort()
+            if rows:
+                sys.stdout.write("\n".join(name + suffix for name, suffix in rows) + "\n")
         except FileNotFoundError:
             print(f"ls: no such file or directory: {path}")
         except NotADirectoryError:
@@ -143,12 +323,16 @@ class PyTerminal(cmd.Cmd):
         """cd <path> — change current directory."""
         if not arg.strip():
             # go to home if no argument
-            target = os.path.expanduser("~")
+            target = _HOME
         else:
-            (target,) = shlex.split(arg)
+            (target,) = _split(arg)
             target = _expand_path(target)
         try:
             os.chdir(target)
+            # only cd changes our cwd, so the prompt is rebuilt here and nowhere else
+            self._cwd = os.getcwd()
+            if not self.script:
+                self.prompt = f"{self._cwd} $ "
         except FileNotFoundError:
             print(f"cd: no such file or directory: {target}")
         except NotADirectoryError:
@@ -167,7 +351,7 @@ class PyTerminal(cmd.Cmd):
 
     def do_mkdir(self, arg):
         """mkdir [-p] <dirname> — create a directory. Use -p to create parent directories."""
-        args = shlex.split(arg)
+        args = _split(arg)
         if not args:
             print("usage: mkdir [-p] <dirname>")
             return
@@ -194,7 +378,7 @@ class PyTerminal(cmd.Cmd):
 
     def do_rm(self, arg):
         """rm [-r] <path> — remove file. Use -r to remove directories recursively."""
-        args = shlex.split(arg)
+        args = _split(arg)
         if not args:
             print("usage: rm [-r] <path>")
             return
@@ -209,6 +393,8 @@ class PyTerminal(cmd.Cmd):
         if _is_dir(target):
             if r_flag:
                 try:
+                    # on POSIX rmtree already walks the tree fd-relative (openat/unlinkat),
+                    # without resolving a full path per entry
                     shutil.rmtree(target)
                     print(f"removed directory: {target}")
                 except Exception as e:
@@ -232,15 +418,25 @@ class PyTerminal(cmd.Cmd):
 
     def do_cat(self, arg):
         """cat <filename> — display file contents."""
-        args = shlex.split(arg)
+        args = _split(arg)
         if not args:
             print("usage: cat <file>")
             return
         path = _expand_path(args[0])
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    print(line, end="")
+            with open(path, "rb", buffering=0) as f:
+                # stream raw bytes straight to stdout: no decoding, no line splitting
+                buf = bytearray(CAT_BUFSIZE)
+                mv = memoryview(buf)
+                sys.stdout.flush()
+                out = sys.stdout.buffer
+                write = out.write
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    write(mv[:n])
+                out.flush()
         except FileNotFoundError:
             print(f"cat: no such file: {path}")
         except IsADirectoryError:
@@ -253,14 +449,24 @@ class PyTerminal(cmd.Cmd):
 
     def do_touch(self, arg):
         """touch <filename> — create an empty file or update modification time."""
-        args = shlex.split(arg)
+        args = _split(arg)
         if not args:
             print("usage: touch <file>")
             return
         path = _expand_path(args[0])
         try:
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            Path(path).touch()
+            try:
+                # existing file (the usual case): a single utime call
+                os.utime(path, None)
+            except FileNotFoundError:
+                flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_NONBLOCK", 0)
+                try:
+                    fd = os.open(path, flags, 0o666)
+                except FileNotFoundError:
+                    # parent directory missing: create it only now
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    fd = os.open(path, flags, 0o666)
+                os.close(fd)
         except Exception as e:
             print(f"touch: error: {e}")
 
@@ -269,8 +475,13 @@ class PyTerminal(cmd.Cmd):
 
     def do_history(self, arg):
         """history — show the command history for this session."""
-        for i, cmdline in enumerate(self.history[-200:], start=max(1, len(self.history)-199)):
-            print(f"{i}: {cmdline}")
+        skip = max(0, len(self.history) - 200)
+        # number entries by their position in the whole session, not just the buffer
+        start = self._history_total - len(self.history) + skip + 1
+        shown = itertools.islice(self.history, skip, None)
+        out = "\n".join(f"{i}: {c}" for i, c in enumerate(shown, start=start))
+        if out:
+            sys.stdout.write(out + "\n")
 
     # -------------------------
     # system & processes (psutil optional)
@@ -278,19 +489,51 @@ class PyTerminal(cmd.Cmd):
     def do_ps(self, arg):
         """ps — list running processes (if psutil installed), otherwise tries 'ps' or 'tasklist'."""
         if psutil:
-            print(f"{'PID':>6}  {'Name':30} {'CPU%':>6} {'Mem%':>6}")
-            for p in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent"]):
+            # cpu_percent needs two samples, so it is left to `top`
+            lines = [f"{'PID':>6}  {'Name':30} {'Mem%':>6}"]
+            for p in psutil.process_iter(["pid", "name", "memory_percent"]):
                 try:
                     info = p.info
-                    print(f"{info['pid']:6}  {info['name'][:30]:30} {info['cpu_percent']:6} {info['memory_percent']:.2f}")
+                    lines.append(f"{info['pid']:6}  {info['name'][:30]:30} {info['memory_percent']:6.2f}")
                 except Exception:
                     continue
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             # fallback: system command
             if sys.platform.startswith("win"):
-                subprocess.run(["tasklist"])
+                _run_program(["tasklist"])
             else:
-                subprocess.run(["ps", "aux"])
+                _run_program(["ps", "aux"])
+
+    def do_top(self, arg):
+        """top [n] — show the n (default 15) processes using the most CPU, sampled over a short interval (requires psutil)."""
+        if not psutil:
+            print("top: psutil not installed. Install with `pip install psutil` to get process metrics.")
+            return
+        args = _split(arg)
+        try:
+            count = int(args[0]) if args else 15
+        except ValueError:
+            print("usage: top [n]")
+            return
+        # first call primes each process's cpu counters, the second reads the delta
+        procs = list(psutil.process_iter(["pid", "name"]))
+        for p in procs:
+            try:
+                p.cpu_percent(None)
+            except Exception:
+                pass
+        time.sleep(0.3)
+        rows = []
+        for p in procs:
+            try:
+                rows.append((p.cpu_percent(None), p.info["pid"], p.info["name"] or ""))
+            except Exception:
+                continue
+        rows.sort(reverse=True)
+        lines = [f"{'PID':>6}  {'Name':30} {'CPU%':>6}"]
+        lines.extend(f"{pid:6}  {name[:30]:30} {cpu:6.1f}" for cpu, pid, name in rows[:count])
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def do_sys(self, arg):
         """sys — show CPU and memory usage (requires psutil)."""
@@ -308,13 +551,116 @@ class PyTerminal(cmd.Cmd):
     # -------------------------
     # run shell commands
     # -------------------------
+    def _spawn_shell(self):
+        """Start the long-lived bash used for piped shell commands (None if unavailable)."""
+        # POSIX only: on Windows `bash` is usually WSL or Git Bash, which can't
+        # take our POSIX-quoted `cd` lines for a native cwd
+        if os.name != "posix":
+            return None
+        bash = shutil.which("bash")
+        if not bash:
+            return None
+        # binary pipes: output is decoded per line so stray non-UTF-8 bytes can't break reads
+        return subprocess.Popen([bash, "-s"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+
+    def close_shell(self, kill: bool = False):
+        """Stop the persistent shell, if one is running (kill it if it may be mid-command)."""
+        sh = self._sh
+        self._sh = None
+        if sh is not None and sh.poll() is None:
+            try:
+                if kill:
+                    sh.kill()
+                else:
+                    sh.stdin.close()
+                sh.wait(timeout=1)
+            except Exception:
+                sh.kill()
+
+    def run_shell(self, commands):
+        """Run each command string in the persistent shell, printing output as it arrives.
+
+        All commands are sent in one write and separated by sentinel lines, so a
+        batch costs a single round trip. Commands get stdin from /dev/null and a
+        pipe for stdout/stderr, so this is for non-interactive use only. Falls
+        back to one subprocess per command when bash is not available (e.g. on
+        Windows).
+        """
+        if self._sh is None or self._sh.poll() is not None:
+            self._sh = self._spawn_shell()
+        if self._sh is None:
+            for command in commands:
+                subprocess.run(command, shell=True)
+            return
+        # eval keeps syntax errors from killing the shell; stdin is detached so a
+        # command can't swallow the sentinel lines that follow it
+        cd = f"cd {shlex.quote(self._cwd)}\n"
+        script = "".join(f"{cd}eval {shlex.quote(c)} </dev/null\necho \"{SHELL_SENTINEL}$?\"\n"
+                         for c in commands)
+        try:
+            self._sh.stdin.write(script.encode())
+            self._sh.stdin.flush()
+        except (BrokenPipeError, OSError):
+            # shell died between commands; start a fresh one next time
+            self.close_shell()
+            print("shell: error: shell process exited")
+            return
+        pending = len(commands)
+        try:
+            while pending:
+                line = self._sh.stdout.readline()
+                if not line:
+                    # the command ended the shell (e.g. `exit`); respawn on next use
+                    self.close_shell()
+                    return
+                line = line.decode("utf-8", errors="replace")
+                idx = line.find(SHELL_SENTINEL)
+                if idx < 0:
+                    sys.stdout.write(line)
+                    continue
+                # output without a trailing newline lands on the sentinel line
+                if idx:
+                    sys.stdout.write(line[:idx] + "\n")
+                pending -= 1
+        except BaseException:
+            # unread output and sentinels would leave the shell out of step
+            # with us (e.g. after Ctrl-C), so throw it away
+            self.close_shell(kill=True)
+            raise
+        finally:
+            sys.stdout.flush()
+
     def do_shell(self, arg):
         """shell <command> — run an external shell command."""
         if not arg.strip():
             print("usage: shell <command>")
             return
+        # At an interactive terminal each command gets a fresh shell attached to
+        # the tty, so editors, pagers and password prompts work (shell variables
+        # don't carry over). In --script mode or with piped input it goes to the
+        # persistent bash instead: variables persist, there is no stdin, and
+        # stderr is merged into stdout.
+        try:
+            if not self.script and sys.stdin.isatty():
+                if os.name == "posix":
+                    # posix_spawn fast path instead of fork + exec
+                    _run_program(["/bin/sh", "-c", arg])
+                else:
+                    subprocess.run(arg, shell=True)
+            else:
+                self.run_shell([arg])
+        except Exception as e:
+            print(f"shell: error: {e}")
+
+    def do_shell_batch(self, arg):
+        """shell_batch "<cmd1>" "<cmd2>" ... — run several non-interactive shell commands in one round trip."""
+        commands = _split(arg)
+        if not commands:
+            print('usage: shell_batch "<command>" ["<command>" ...]')
+            return
         try:
-            subprocess.run(arg, shell=True)
+            self.run_shell(commands)
         except Exception as e:
             print(f"shell: error: {e}")
 
@@ -326,19 +672,16 @@ class PyTerminal(cmd.Cmd):
         if line.startswith("!"):
             cmd = line[1:].strip()
             if cmd:
-                try:
-                    subprocess.run(cmd, shell=True)
-                except Exception as e:
-                    print(f"shell: error: {e}")
+                self.do_shell(cmd)
             return
 
         # try running as external program
         try:
-            parts = shlex.split(line)
+            parts = _split(line)
         except Exception:
             parts = [line]
         try:
-            subprocess.run(parts)
+            _run_program(parts)
         except FileNotFoundError:
             print(f"command not found: {line}")
         except Exception as e:
@@ -354,28 +697,31 @@ class PyTerminal(cmd.Cmd):
     # -------------------------
     def do_exit(self, arg):
         """exit — exit the terminal."""
-        print("Bye.")
+        if not self.script:
+            print("Bye.")
         return True
 
     def do_EOF(self, arg):
         """Ctrl-D / EOF — exit."""
-        print("Bye.")
+        if not self.script:
+            print("Bye.")
         return True
 
 
 def main():
-    term = PyTerminal()
+    parser = argparse.ArgumentParser(description="A simple Python command terminal.")
+    parser.add_argument("--script", action="store_true",
+                        help="batch mode: read commands from stdin without readline or history")
+    opts = parser.parse_args()
+    term = PyTerminal(script=opts.script)
     try:
         term.cmdloop()
     except KeyboardInterrupt:
         print("\nKeyboardInterrupt — exiting.")
     finally:
         # try to save history persistently
-        if readline:
-            try:
-                readline.write_history_file(HISTORY_FILE)
-            except Exception:
-                pass
+        term.save_history(final=True)
+        term.close_shell()
 
 
 if __name__ == "__main__":
@@ -7,12 +7,15 @@ It exposes a tiny allowlist of safe commands implemented in Python
 so it works on Windows, macOS, and Linux.
 """
 
-from flask import Flask, request, render_template, jsonify
+from flask import Flask, request, render_template, jsonify, Response, send_file
 import shlex
 import os
+import functools
 from pathlib import Path
 import json
 import shutil
+import stat
+from types import MappingProxyType
 
 # optional psutil imports
 try:
@@ -22,11 +25,40 @@ except Exception:
 
 app = Flask(__name__)
 
+_HOME = os.path.expanduser("~")
+# expanduser drops the home directory's trailing separator before joining ("/" -> "")
+_HOME_PREFIX = _HOME.rstrip(os.sep)
+CAT_BUFSIZE = 128 * 1024  # chunk size for reading files in `cat`
+CAT_INLINE_MAX = 64 * 1024  # files at least this big are streamed instead of JSON-wrapped
+# /cat only serves files below this directory
+CAT_ROOT = os.path.realpath(os.environ.get("PYTERM_ROOT", os.getcwd()))
+
 # ---------- utility functions ----------
+@functools.lru_cache(maxsize=1024)
 def _expand_path(p: str):
+    # cached: the server's environment and home directory don't change at runtime
     if not p:
         return p
-    return os.path.normpath(os.path.expanduser(os.path.expandvars(p)))
+    p = os.path.expandvars(p)
+    if p == "~":
+        p = _HOME
+    elif p.startswith(("~/", "~" + os.sep)):
+        p = _HOME_PREFIX + p[1:]
+    else:
+        p = os.path.expanduser(p)
+    return os.path.normpath(p)
+
+def _split(arg):
+    """Split a command line into words; shlex is only needed for quotes and escapes."""
+    if any(c in arg for c in "\"'\\"):
+        return shlex.split(arg)
+    return arg.split()
+
+def _entry_is_dir(entry):
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
 
 def safe_ls(args):
     """List directory contents. args: list of path parts (maybe empty)."""
@@ -36,13 +68,10 @@ def safe_ls(args):
         if not os.path.exists(path):
             return {"ok": False, "output": f"ls: no such file or directory: {path}"}
         if os.path.isdir(path):
-            entries = sorted(os.listdir(path))
-            out_lines = []
-            for name in entries:
-                full = os.path.join(path, name)
-                suffix = "/" if os.path.isdir(full) else ""
-                out_lines.append(name + suffix)
-            return {"ok": True, "output": "\n".join(out_lines)}
+            # DirEntry.is_dir() uses d_type from the directory read, no stat per entry
+            with os.scandir(path) as it:
+                rows = sorted((e.name, "/" if _entry_is_dir(e) else "") for e in it)
+            return {"ok": True, "output": "\n".join(name + suffix for name, suffix in rows)}
         else:
             # if path is a file, just show the filename
             return {"ok": True, "output": os.path.basename(path)}
@@ -61,8 +90,18 @@ def safe_cat(args):
     try:
         if os.path.isdir(path):
             return {"ok": False, "output": f"cat: {path}: Is a directory"}
-        with open(path, "r", encoding="utf-8") as f:
-            return {"ok": True, "output": f.read()}
+        # read raw bytes in large chunks and decode once at the end
+        data = bytearray()
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            while True:
+                chunk = os.read(fd, CAT_BUFSIZE)
+                if not chunk:
+                    break
+                data += chunk
+        finally:
+            os.close(fd)
+        return {"ok": True, "output": data.decode("utf-8", errors="replace")}
     except FileNotFoundError:
         return {"ok": False, "output": f"cat: no such file: {path}"}
     except PermissionError:
@@ -70,6 +109,14 @@ def safe_cat(args):
     except Exception as e:
         return {"ok": False, "output": f"cat: error: {e}"}
 
+def _large_file(path):
+    """Return True if `path` is a regular file big enough to be streamed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size >= CAT_INLINE_MAX
+
 def safe_mkdir(args):
     if not args:
         return {"ok": False, "output": "mkdir: missing operand"}
@@ -95,6 +142,7 @@ def safe_rm(args):
     try:
         if os.path.isdir(target):
             if r_flag:
+                # fd-relative removal on POSIX (shutil.rmtree.avoids_symlink_attacks)
                 shutil.rmtree(target)
                 return {"ok": True, "output": f"removed directory: {target}"}
             else:
@@ -135,7 +183,8 @@ def safe_sys(args):
         return {"ok": False, "output": "sys: psutil not installed on the server."}
 
 # ---------- allowlist mapping ----------
-ALLOWED = {
+# read-only view: the allowlist can't be extended at runtime
+ALLOWED = MappingProxyType({
     "ls": safe_ls,
     "pwd": safe_pwd,
     "cat": safe_cat,
@@ -143,43 +192,93 @@ ALLOWED = {
     "rm": safe_rm,
     "ps": safe_ps,
     "sys": safe_sys,
-}
+})
+
+# ---------- command dispatch ----------
+def _dispatch(cmdline):
+    """Run an allowlisted command line and return (body, status).
+
+    body is the handler's {"ok": bool, "output": str} dict, or a plain-text
+    file Response for large `cat` output.
+    """
+    if not cmdline:
+        return {"ok": False, "output": "No command provided"}, 400
+
+    # look up the command name first so unknown commands are rejected before parsing
+    parts = cmdline.split(None, 1)
+    name = parts[0]
+    func = ALLOWED.get(name)
+    if not func:
+        return {"ok": False, "output": f"Command not allowed: {name}"}, 403
+
+    # split the arguments safely
+    rest = parts[1] if len(parts) > 1 else ""
+    try:
+        args = _split(rest)
+    except Exception:
+        args = rest.split()
+
+    # large files skip the JSON envelope and are sent as plain text; send_file
+    # hands the open file to the server's wsgi.file_wrapper (sendfile(2) under gunicorn)
+    if name == "cat" and args:
+        path = _expand_path(args[0])
+        if _large_file(path):
+            try:
+                return send_file(os.path.abspath(path), mimetype="text/plain"), 200
+            except OSError:
+                pass  # unreadable: let safe_cat report the error
+
+    try:
+        result = func(args)
+        # result is expected to be a dict {"ok": bool, "output": str}
+        if not isinstance(result, dict) or "ok" not in result or "output" not in result:
+            return {"ok": False, "output": "Internal: command handler returned bad response"}, 500
+        return result, 200
+    except Exception as e:
+        return {"ok": False, "output": f"Error executing command: {e}"}, 500
+
+def _text_response(cmdline):
+    """Run cmdline and return its output as plain text (for the debug routes)."""
+    body, status = _dispatch(cmdline.strip())
+    if isinstance(body, Response):
+        return body
+    return Response(body["output"], status=status, mimetype="text/plain")
 
 # ---------- routes ----------
 @app.route("/")
 def index():
     return render_template("index.html")
 
+@app.route("/cat")
+def cat_file():
+    """Serve a file under CAT_ROOT as plain text (uses sendfile where the server supports it)."""
+    path = _expand_path(request.args.get("path", ""))
+    if not path:
+        return jsonify({"ok": False, "output": "cat: missing file operand"}), 400
+    full = os.path.realpath(os.path.join(CAT_ROOT, path))
+    try:
+        inside = os.path.commonpath([CAT_ROOT, full]) == CAT_ROOT
+    except ValueError:
+        # e.g. a different drive on Windows
+        inside = False
+    if not inside:
+        return jsonify({"ok": False, "output": f"cat: access denied: {path}"}), 403
+    if not os.path.isfile(full):
+        return jsonify({"ok": False, "output": f"cat: no such file: {path}"}), 404
+    return send_file(full, mimetype="text/plain", conditional=True)
+
 @app.route("/ping")
 def ping():
     return jsonify({"ok": True, "msg": "pong"})
-# add this above the /run route (anywhere near other routes)
+
 @app.route("/testform", methods=["GET", "POST"])
 def test_form():
     """
     Very small HTML form to test POSTing to /run from a browser without JS.
-    Submits to /run but we present the response as plain text.
+    Runs the same dispatch as /run but presents the response as plain text.
     """
-    from flask import request, Response, redirect, url_for
     if request.method == "POST":
-        # forward the same form data to the existing /run handler by calling it directly
-        # Build a tiny request-like dict and call run_command()
-        form_cmd = request.form.get("cmd", "")
-        # Call the existing function directly to reuse logic:
-        with app.test_request_context(method="POST", data={"cmd": form_cmd}):
-            resp = run_command()  # reuse existing handler; it returns a Flask Response/json
-            # resp may be a tuple or Response; standardize to Response then return text
-            try:
-                # If resp is (body, status), handle that
-                if isinstance(resp, tuple):
-                    body = resp[0].get_json() if hasattr(resp[0], 'get_json') else resp[0]
-                else:
-                    body = resp.get_json() if hasattr(resp, 'get_json') else resp
-            except Exception:
-                body = {"ok": False, "output": "Internal response parse error"}
-        # return the output as plain text so it's human-readable
-        out_text = body.get("output", "") if isinstance(body, dict) else str(body)
-        return Response(out_text, mimetype="text/plain")
+        return _text_response(request.form.get("cmd", ""))
     # GET: show a simple form
     return """
     <!doctype html>
@@ -194,55 +293,20 @@ def test_form():
       </body>
     </html>
     """
-from flask import request, Response
 
 @app.route("/run_get")
 def run_get():
-    # use query param ?cmd=... to call the same run handler but via GET for quick debugging
-    cmd = request.args.get("cmd", "")
-    # call run_command() inside a test_request_context to reuse the logic
-    with app.test_request_context(method="POST", data={"cmd": cmd}):
-        resp = run_command()
-        # resp may be a Response or (body, status)
-        try:
-            if isinstance(resp, tuple):
-                body = resp[0].get_json() if hasattr(resp[0], "get_json") else resp[0]
-            else:
-                body = resp.get_json() if hasattr(resp, "get_json") else resp
-        except Exception:
-            body = {"ok": False, "output": "internal parse error"}
-    out = body.get("output", "") if isinstance(body, dict) else str(body)
-    return Response(out, mimetype="text/plain")
+    # use query param ?cmd=... to run a command via GET for quick debugging
+    return _text_response(request.args.get("cmd", ""))
 
 
 @app.route("/run", methods=["POST"])
 def run_command():
-    data = request.form
-    cmdline = data.get("cmd", "").strip()
-    if not cmdline:
-        return jsonify({"ok": False, "output": "No command provided"}), 400
-
-    # split safely
-    try:
-        parts = shlex.split(cmdline)
-    except Exception:
-        parts = cmdline.split()
-    name = parts[0]
-    args = parts[1:]
-
-    func = ALLOWED.get(name)
-    if not func:
-        return jsonify({"ok": False, "output": f"Command not allowed: {name}"}), 403
-
-    try:
-        result = func(args)
-        # result is expected to be a dict {"ok": bool, "output": str}
-        if not isinstance(result, dict) or "ok" not in result or "output" not in result:
-            return jsonify({"ok": False, "output": "Internal: command handler returned bad response"}), 500
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"ok": False, "output": f"Error executing command: {e}"}), 500
+    body, status = _dispatch(request.form.get("cmd", "").strip())
+    if isinstance(body, Response):
+        return body
+    return jsonify(body), status
 
 if __name__ == "__main__":
-    # local dev server
+    # local dev server; for serving many clients use gunicorn (see gunicorn.conf.py)
     app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 5000)), debug=True)